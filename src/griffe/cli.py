@@ -14,21 +14,25 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
-import json
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-from griffe.encoders import Encoder
-from griffe.extended_ast import extend_ast
-from griffe.extensions import Extensions
-from griffe.loader import AsyncGriffeLoader, GriffeLoader
 from griffe.logger import get_logger
 
+# optimization: heavy modules (asyncio, the loaders and encoders)
+# are imported in the functions using them, so that showing the help
+# or reporting invalid arguments does not pay for their import time
+
 logger = get_logger(__name__)
 
 
+def _configure_logging():
+    logging.basicConfig(format="%(levelname)-10s %(message)s", level=logging.WARNING)  # noqa: WPS323
+
+
 def _print_data(data, output_file):
     if output_file is sys.stdout:
         print(data)
@@ -37,21 +41,75 @@ def _print_data(data, output_file):
             print(data, file=fd)
 
 
+@lru_cache(maxsize=None)
+def _get_encoder():
+    from griffe.encoders import Encoder  # noqa: WPS433
+
+    # optimization: instantiate the encoder only once per process
+    return Encoder(indent=2, full=True)
+
+
+def _write_json(data, fd):
+    # write chunks as they are encoded instead of building the whole string in memory
+    for chunk in _get_encoder().iterencode(data):
+        fd.write(chunk)
+    print(file=fd)
+
+
+def _dump_json(data, output_file):
+    if output_file is sys.stdout:
+        _write_json(data, sys.stdout)
+    else:
+        with open(output_file, "w") as fd:
+            _write_json(data, fd)
+
+
+def _serialize(data):
+    return _get_encoder().encode(data)
+
+
+def _run_async(coroutine):
+    import asyncio  # noqa: WPS433
+
+    # use uvloop's faster event loop when available, without changing
+    # the process-wide event loop policy (main can be called in-process)
+    if sys.version_info >= (3, 11):
+        try:
+            import uvloop  # type: ignore  # noqa: WPS433
+        except ModuleNotFoundError:
+            logger.debug("uvloop is not installed, using the default event loop")
+        else:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(coroutine)
+    return asyncio.run(coroutine)
+
+
 async def _load_packages_async(packages, extensions, search_paths):
+    import asyncio  # noqa: WPS433
+
+    from griffe.loader import AsyncGriffeLoader  # noqa: WPS433
+
     loader = AsyncGriffeLoader(extensions=extensions)
     loaded = {}
+    coroutines = []
     for package in packages:
         logger.info(f"Loading package {package}")
-        try:
-            module = await loader.load_module(package, search_paths=search_paths)
-        except ModuleNotFoundError:
+        coroutines.append(loader.load_module(package, search_paths=search_paths))
+    # load all packages concurrently, collecting errors instead of aborting on the first one
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    for package, result in zip(packages, results):
+        if isinstance(result, ModuleNotFoundError):
             logger.error(f"Could not find package {package}")
+        elif isinstance(result, BaseException):
+            raise result
         else:
-            loaded[module.name] = module
+            loaded[result.name] = result
     return loaded
 
 
 def _load_packages(packages, extensions, search_paths):
+    from griffe.loader import GriffeLoader  # noqa: WPS433
+
     loader = GriffeLoader(extensions=extensions)
     loaded = {}
     for package in packages:
@@ -65,6 +123,34 @@ def _load_packages(packages, extensions, search_paths):
     return loaded
 
 
+def _load_package_in_thread(package, extensions, search_paths):
+    from griffe.loader import GriffeLoader  # noqa: WPS433
+
+    # each thread needs its own extensions container: instantiating extensions
+    # for a visit replaces the instances bound to the previous visitor
+    loader = GriffeLoader(extensions=extensions.copy())
+    return loader.load_module(package, search_paths=search_paths)
+
+
+def _load_packages_threaded(packages, extensions, search_paths):
+    from concurrent.futures import ThreadPoolExecutor  # noqa: WPS433
+
+    loaded = {}
+    with ThreadPoolExecutor() as executor:
+        futures = []
+        for package in packages:
+            logger.info(f"Loading package {package}")
+            futures.append(executor.submit(_load_package_in_thread, package, extensions, search_paths))
+        for package, future in zip(packages, futures):
+            try:
+                module = future.result()
+            except ModuleNotFoundError:
+                logger.error(f"Could not find package {package}")
+            else:
+                loaded[module.name] = module
+    return loaded
+
+
 def get_parser() -> argparse.ArgumentParser:
     """
     Return the program argument parser.
@@ -73,7 +159,8 @@ def get_parser() -> argparse.ArgumentParser:
         The argument parser for the program.
     """
     parser = argparse.ArgumentParser(prog="griffe", add_help=False)
-    parser.add_argument(
+    loader_group = parser.add_mutually_exclusive_group()
+    loader_group.add_argument(
         "-A",
         "--async-loader",
         action="store_true",
@@ -81,6 +168,13 @@ def get_parser() -> argparse.ArgumentParser:
         "Very large projects with many files will be processed faster. "
         "Small projects with a few files will not see any speed up.",
     )
+    loader_group.add_argument(
+        "-T",
+        "--threaded-loader",
+        action="store_true",
+        help="Whether to load packages in parallel threads, without an event loop. "
+        "Only useful when loading multiple packages.",
+    )
     parser.add_argument(
         "-a",
         "--append-sys-path",
@@ -125,34 +219,48 @@ def main(args: list[str] | None = None) -> int:  # noqa: WPS231
     parser = get_parser()
     opts: argparse.Namespace = parser.parse_args(args)  # type: ignore
 
-    logging.basicConfig(format="%(levelname)-10s %(message)s", level=logging.WARNING)  # noqa: WPS323
+    _configure_logging()
 
     output = opts.output
 
-    per_package_output = False
-    if isinstance(output, str) and output.format(package="package") != output:
-        per_package_output = True
+    per_package_output = isinstance(output, str) and "{package}" in output
 
     search = opts.search
     if opts.append_sys_path:
         search.extend(sys.path)
 
+    from griffe.extended_ast import extend_ast  # noqa: WPS433
+    from griffe.extensions import Extensions  # noqa: WPS433
+
     extend_ast()
     extensions = Extensions()
 
     if opts.async_loader:
-        loop = asyncio.get_event_loop()
         coroutine = _load_packages_async(opts.packages, extensions=extensions, search_paths=search)
-        packages = loop.run_until_complete(coroutine)
+        packages = _run_async(coroutine)
+    elif opts.threaded_loader:
+        packages = _load_packages_threaded(opts.packages, extensions=extensions, search_paths=search)
     else:
         packages = _load_packages(opts.packages, extensions=extensions, search_paths=search)
 
     if per_package_output:
-        for package_name, data in packages.items():
-            serialized = json.dumps(data, cls=Encoder, indent=2, full=True)
-            _print_data(serialized, output.format(package=package_name))
+        if len(packages) > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed  # noqa: WPS433
+
+            # serialization is CPU-bound: spread packages over multiple processes,
+            # and write each file as soon as its package is serialized,
+            # while the other packages are still being serialized;
+            # workers configure logging themselves since spawned processes don't run `main`,
+            # and there is no point in starting (or forking) more workers than packages
+            max_workers = min(len(packages), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_configure_logging) as executor:
+                futures = {executor.submit(_serialize, data): name for name, data in packages.items()}
+                for future in as_completed(futures):
+                    _print_data(future.result(), output.replace("{package}", futures[future]))
+        else:
+            for package_name, data in packages.items():
+                _dump_json(data, output.replace("{package}", package_name))
     else:
-        serialized = json.dumps(packages, cls=Encoder, indent=2, full=True)
-        _print_data(serialized, output)
+        _dump_json(packages, output)
 
     return 0 if len(packages) == len(opts.packages) else 1
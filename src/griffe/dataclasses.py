@@ -80,6 +80,7 @@ class Docstring:
         self.lineno: int | None = lineno
         self.endlineno: int | None = endlineno
         self.parent: Module | Class | Function | Data | None = parent
+        self._parsed_cache: dict[tuple[Parser, frozenset], list[DocstringSection]] = {}
 
     @cached_property
     def lines(self) -> list[str]:
@@ -102,6 +103,11 @@ class Docstring:
     def parse(self, docstring_parser: Parser = Parser.google, **options) -> list[DocstringSection]:
         """Parse the docstring into structured data.
 
+        Results are cached for each parser and set of options,
+        so the docstring is parsed (and warnings are logged) only once.
+        The same list is returned on each call: copy it before modifying it.
+        See [`invalidate`][griffe.dataclasses.Docstring.invalidate].
+
         Arguments:
             docstring_parser: The docstring parser to use.
             **options: Additional docstring parsing options.
@@ -109,7 +115,24 @@ class Docstring:
         Returns:
             The parsed docstring.
         """
-        return parse(self, docstring_parser, **options)
+        try:
+            cache_key = (docstring_parser, frozenset(options.items()))
+        except TypeError:
+            # unhashable options, don't cache
+            return parse(self, docstring_parser, **options)
+        if cache_key not in self._parsed_cache:
+            self._parsed_cache[cache_key] = parse(self, docstring_parser, **options)
+        return self._parsed_cache[cache_key]
+
+    def invalidate(self) -> None:
+        """Forget the lines and sections previously computed from the docstring value.
+
+        Extensions that modify the value of a docstring after it was parsed
+        must call this method so that it gets parsed again.
+        """
+        self._parsed_cache.clear()
+        self.__dict__.pop("lines", None)
+        self.__dict__.pop("parsed", None)
 
     def as_dict(self, full: bool = False, docstring_parser: Parser = Parser.google, **kwargs) -> dict[str, Any]:
         """Return this docstring's data as a dictionary.
@@ -142,6 +165,8 @@ class Argument:
         default: The argument default, if any.
     """
 
+    __slots__ = ("name", "annotation", "kind", "default")
+
     def __init__(self, name: str, annotation: str | None, kind: ParameterKind, default: str | None) -> None:
         """Initialize the argument.
 
@@ -179,6 +204,8 @@ class Arguments:
     It allows to get arguments using their position (index) or their name.
     """
 
+    __slots__ = ("_arguments_list", "_arguments_dict")
+
     def __init__(self) -> None:
         """Initialize the arguments container."""
         self._arguments_list: list[Argument] = []
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Pattern
+import sys
+from typing import TYPE_CHECKING, Callable, Pattern
 
 from griffe.docstrings.dataclasses import (
     DocstringArgument,
@@ -22,8 +23,15 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Performance notes: this parser only manipulates strings.
+# Don't decorate its functions with Numba: string operations run in object mode there, and get slower.
+# It is not compiled with mypyc either: compiled modules bind calls to module-level functions
+# at build time, so patching functions like `warn`, as tests and downstream tools do, would stop working.
+# Prefer plain CPython optimizations: cheap checks (`str.startswith`, `str.endswith`, `in`) before
+# expensive ones, dictionary lookups, and work hoisted out of loops.
 
-section_kind = {
+
+section_kind: dict[str, DocstringSectionKind] = {
     "args:": DocstringSectionKind.arguments,
     "arguments:": DocstringSectionKind.arguments,
     "params:": DocstringSectionKind.arguments,
@@ -57,7 +65,8 @@ def read_block_items(docstring: Docstring, start_index: int) -> tuple[list[str],
         A tuple containing the list of concatenated lines and the index at which to continue parsing.
     """
     lines = docstring.lines
-    if start_index >= len(lines):
+    lines_count = len(lines)
+    if start_index >= lines_count:
         return [], start_index
 
     index = start_index
@@ -74,19 +83,24 @@ def read_block_items(docstring: Docstring, start_index: int) -> tuple[list[str],
         # first non-empty line was not indented, abort
         return [], index - 1
 
+    # optimization: compute indentation prefixes once, not for each line
+    cont_indent_prefix = indent * 2 * " "
+    extra_indent_prefix = (indent + 1) * " "
+    indent_prefix = indent * " "
+
     # start processing first item
     current_item = [lines[index][indent:]]
     index += 1
 
     # loop on next lines
-    while index < len(lines):
+    while index < lines_count:
         line = lines[index]
 
-        if line.startswith(indent * 2 * " "):
+        if line.startswith(cont_indent_prefix):
             # continuation line
             current_item.append(line[indent * 2 :])
 
-        elif line.startswith((indent + 1) * " "):
+        elif line.startswith(extra_indent_prefix):
             # indent between initial and continuation: append but warn
             cont_indent = len(line) - len(line.lstrip())
             current_item.append(line[cont_indent:])
@@ -97,7 +111,7 @@ def read_block_items(docstring: Docstring, start_index: int) -> tuple[list[str],
                 f"should be {indent} * 2 = {indent*2} spaces, not {cont_indent}",
             )
 
-        elif line.startswith(indent * " "):
+        elif line.startswith(indent_prefix):
             # indent equal to initial one: new item
             items.append("\n".join(current_item))
             current_item = [line[indent:]]
@@ -118,9 +132,9 @@ def read_block_items(docstring: Docstring, start_index: int) -> tuple[list[str],
     return items, index - 1
 
 
-def read_block(docstring: Docstring, start_index: int) -> tuple[str, int]:
+def read_block_lines(docstring: Docstring, start_index: int) -> tuple[list[str], int]:
     """
-    Parse an indented block.
+    Parse an indented block as a list of dedented lines.
 
     Arguments:
         docstring: The docstring to parse
@@ -130,8 +144,9 @@ def read_block(docstring: Docstring, start_index: int) -> tuple[str, int]:
         A tuple containing the list of lines and the index at which to continue parsing.
     """
     lines = docstring.lines
-    if start_index >= len(lines):
-        return "", start_index
+    lines_count = len(lines)
+    if start_index >= lines_count:
+        return [], start_index
 
     index = start_index
     block: list[str] = []
@@ -145,18 +160,60 @@ def read_block(docstring: Docstring, start_index: int) -> tuple[str, int]:
 
     if indent == 0:
         # first non-empty line was not indented, abort
-        return "", index - 1
+        return [], index - 1
 
     # start processing first item
     block.append(lines[index].lstrip())
     index += 1
 
     # loop on next lines
-    while index < len(lines) and (lines[index].startswith(indent * " ") or is_empty_line(lines[index])):
+    indent_prefix = indent * " "
+    while index < lines_count and (lines[index].startswith(indent_prefix) or is_empty_line(lines[index])):
         block.append(lines[index][indent:])
         index += 1
 
-    return "\n".join(block).rstrip("\n"), index - 1
+    # remove trailing empty lines
+    while not block[-1]:
+        block.pop()
+
+    return block, index - 1
+
+
+def read_block(docstring: Docstring, start_index: int) -> tuple[str, int]:
+    """
+    Parse an indented block.
+
+    Arguments:
+        docstring: The docstring to parse
+        start_index: The line number to start at.
+
+    Returns:
+        A tuple containing the block text and the index at which to continue parsing.
+    """
+    block, index = read_block_lines(docstring, start_index)
+    return "\n".join(block), index
+
+
+def _split_item(item: str) -> tuple[str, str | None, str]:
+    # split a "name (type): description" item, the type being optional;
+    # str.split is faster than matching a regular expression here
+    name_with_type, description = item.split(":", 1)
+
+    # use the type given after the name, if any
+    # (optimization: names and types repeat a lot across docstrings,
+    # intern them to share a single string object for each value)
+    annotation: str | None
+    if " " in name_with_type:
+        name, type_ = name_with_type.split(" ", 1)
+        annotation = type_.strip("()")
+        if annotation.endswith(", optional"):
+            annotation = annotation[:-10]
+        annotation = sys.intern(annotation)
+    else:
+        name = name_with_type
+        annotation = None
+
+    return sys.intern(name), annotation, description.lstrip()
 
 
 def read_arguments(docstring: Docstring, start_index: int) -> tuple[list[DocstringArgument], int]:  # noqa: WPS231
@@ -170,8 +227,7 @@ def read_arguments(docstring: Docstring, start_index: int) -> tuple[list[Docstri
     Returns:
         A tuple containing a list of docstring arguments and the index at which to continue parsing.
     """
-    arguments = []
-    type_: str
+    arguments: list[DocstringArgument] = []
     annotation: str | None
 
     block, index = read_block_items(docstring, start_index)
@@ -180,21 +236,12 @@ def read_arguments(docstring: Docstring, start_index: int) -> tuple[list[Docstri
 
         # check the presence of a name and description, separated by a semi-colon
         try:
-            name_with_type, description = arg_line.split(":", 1)
+            name, annotation, description = _split_item(arg_line)
         except ValueError:
             warn(docstring, index, f"Failed to get 'name: description' pair from '{arg_line}'")
             continue
 
-        description = description.lstrip()
-
-        # use the type given after the argument name, if any
-        if " " in name_with_type:
-            name, type_ = name_with_type.split(" ", 1)
-            annotation = type_.strip("()")
-            if annotation.endswith(", optional"):  # type: ignore
-                annotation = annotation[:-10]  # type: ignore
-        else:
-            name = name_with_type
+        if annotation is None:
             # try to use the annotation from the signature
             try:
                 annotation = docstring.parent.arguments[name].annotation  # type: ignore
@@ -265,28 +312,16 @@ def read_attributes_section(docstring: Docstring, start_index: int) -> tuple[Doc
     Returns:
         A tuple containing a `Section` (or `None`) and the index at which to continue parsing.
     """
-    attributes = []
+    attributes: list[DocstringAttribute] = []
     block, index = read_block_items(docstring, start_index)
 
-    annotation: str | None
     for attr_line in block:
         try:
-            name_with_type, description = attr_line.split(":", 1)
+            name, annotation, description = _split_item(attr_line)
         except ValueError:
             warn(docstring, index, f"Failed to get 'name: description' pair from '{attr_line}'")
             continue
 
-        description = description.lstrip()
-
-        if " " in name_with_type:
-            name, annotation = name_with_type.split(" ", 1)
-            annotation = annotation.strip("()")
-            if annotation.endswith(", optional"):
-                annotation = annotation[:-10]
-        else:
-            name = name_with_type
-            annotation = None
-
         attributes.append(DocstringAttribute(name=name, annotation=annotation, description=description))
 
     if attributes:
@@ -307,7 +342,7 @@ def read_raises_section(docstring: Docstring, start_index: int) -> tuple[Docstri
     Returns:
         A tuple containing a `Section` (or `None`) and the index at which to continue parsing.
     """
-    exceptions = []
+    exceptions: list[DocstringException] = []
     block, index = read_block_items(docstring, start_index)
 
     for exception_line in block:
@@ -417,15 +452,17 @@ def read_examples_section(  # noqa: WPS231
     Returns:
         A tuple containing a `Section` (or `None`) and the index at which to continue parsing.
     """
-    text, index = read_block(docstring, start_index)
+    # optimization: iterate directly on the dedented lines instead of joining and splitting them again
+    block, index = read_block_lines(docstring, start_index)
 
-    sub_sections = []
+    sub_sections: list[tuple[DocstringSectionKind, str]] = []
     in_code_example = False
     in_code_block = False
     current_text: list[str] = []
     current_example: list[str] = []
 
-    for line in text.split("\n"):
+    # an empty block yields a single empty text sub-section, as splitting an empty string does
+    for line in block or [""]:
         if is_empty_line(line):
             if in_code_example:
                 if current_example:
@@ -467,7 +504,7 @@ def read_examples_section(  # noqa: WPS231
     return None, index
 
 
-def is_empty_line(line) -> bool:
+def is_empty_line(line: str) -> bool:
     """
     Tell if a line is empty.
 
@@ -480,7 +517,7 @@ def is_empty_line(line) -> bool:
     return not line.strip()
 
 
-section_reader = {
+section_reader: dict[DocstringSectionKind, Callable[[Docstring, int], tuple[DocstringSection | None, int]]] = {
     DocstringSectionKind.arguments: read_arguments_section,
     DocstringSectionKind.keyword_arguments: read_keyword_arguments_section,
     DocstringSectionKind.raises: read_raises_section,
@@ -508,48 +545,57 @@ def parse(  # noqa: WPS231
     Returns:
         The list of parsed sections.
     """
-    sections = []
-    current_section = []
+    # optimization: without any colon, there can't be sections nor admonitions,
+    # so the whole docstring is a single text section
+    if ":" not in docstring.value:
+        return [DocstringSection(DocstringSectionKind.text, docstring.value.rstrip("\n"))]
+
+    sections: list[DocstringSection] = []
+    current_section: list[str] = []
+    # optimization: the current section list is cleared and reused, so its append method can be bound once
+    append_line = current_section.append
 
     in_code_block = False
 
     lines = docstring.lines
+    lines_count = len(lines)
     index = 0
 
-    while index < len(lines):
-        line_lower = lines[index].lower()
+    while index < lines_count:
+        line = lines[index]
 
         if in_code_block:
-            if line_lower.lstrip(" ").startswith("```"):
+            if line.lstrip(" ").startswith("```"):
                 in_code_block = False
-            current_section.append(lines[index])
+            append_line(line)
 
-        elif line_lower in section_kind:
+        # optimization: section titles end with a colon, don't lowercase other lines
+        elif line.endswith(":") and (kind := section_kind.get(line.lower())):  # noqa: WPS332
             if current_section:
                 if any(current_section):
                     sections.append(
                         DocstringSection(DocstringSectionKind.text, "\n".join(current_section).rstrip("\n"))
                     )
-                current_section = []
-            reader = section_reader[section_kind[line_lower]]
+                current_section.clear()
+            reader = section_reader[kind]
             section, index = reader(docstring, index + 1)
             if section:
                 sections.append(section)
 
-        elif line_lower.lstrip(" ").startswith("```"):
+        elif line.lstrip(" ").startswith("```"):
             in_code_block = True
-            current_section.append(lines[index])
+            append_line(line)
 
         else:
-            if replace_admonitions and not in_code_block and index + 1 < len(lines):
-                if match := RE_GOOGLE_STYLE_ADMONITION.match(lines[index]):  # noqa: WPS332
-                    groups = match.groupdict()
-                    indent = groups["indent"]
+            # don't modify the lines in place: they are cached on the docstring object
+            if replace_admonitions and not in_code_block and index + 1 < lines_count and ":" in line:
+                if match := RE_GOOGLE_STYLE_ADMONITION.match(line):  # noqa: WPS332
+                    indent = match["indent"]
                     if lines[index + 1].startswith(indent + " " * 4):
-                        lines[index] = f"{indent}!!! {groups['type'].lower()}"
-                        if groups["title"]:
-                            lines[index] += f' "{groups["title"]}"'
-            current_section.append(lines[index])
+                        line = f"{indent}!!! {match['type'].lower()}"
+                        if match["title"]:
+                            line += f' "{match["title"]}"'
+            append_line(line)
 
         index += 1
 
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from griffe.docstrings.dataclasses import DocstringSection
 from griffe.docstrings.google import parse as parse_google
+from griffe.docstrings.rst import parse as parse_rst
 
 if TYPE_CHECKING:
     from griffe.dataclasses import Docstring
@@ -16,10 +17,12 @@ class Parser(enum.Enum):
     """Enumeration for the different docstring parsers."""
 
     google = "google"
+    rst = "rst"
 
 
-parsers = {
+parsers: dict[Parser, Callable[..., list[DocstringSection]]] = {
     Parser.google: parse_google,
+    Parser.rst: parse_rst,
 }
 
 
@@ -7,7 +7,9 @@ See https://github.com/mkdocstrings/pytkdocs/pull/71.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Any, Callable, FrozenSet, TypedDict
 
 from griffe.docstrings.dataclasses import (
@@ -32,6 +34,9 @@ RETURN_NAMES = frozenset(("returns", "return"))
 RETURN_TYPE_NAMES = frozenset(("rtype",))
 EXCEPTION_NAMES = frozenset(("raises", "raise", "except", "exception"))
 
+# slotted dataclasses (faster attribute access, smaller instances) are only supported on Python 3.10+
+_slots: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass(frozen=True)
 class FieldType:
@@ -59,7 +64,7 @@ class AttributesDict(TypedDict):
     annotation: str | None
 
 
-@dataclass
+@dataclass(**_slots)
 class ParsedDirective:
     """Directive information that has been parsed from a docstring."""
 
@@ -70,7 +75,7 @@ class ParsedDirective:
     invalid: bool = False
 
 
-@dataclass
+@dataclass(**_slots)
 class ParsedValues:
     """Values parsed from the docstring to be used to produce sections."""
 
@@ -96,18 +101,20 @@ def parse(docstring: Docstring, **options) -> list[DocstringSection]:
     """
     parsed_values = ParsedValues()
 
+    # optimization: bind what the loop uses to local names
     lines = docstring.lines
+    lines_count = len(lines)
+    get_reader = _get_reader
+    append_description = parsed_values.description.append
     curr_line_index = 0
 
-    while curr_line_index < len(lines):
+    while curr_line_index < lines_count:
         line = lines[curr_line_index]
-        for field_type in field_types:
-            if field_type.matches(line):
-                # https://github.com/python/mypy/issues/5485
-                curr_line_index = field_type.reader(docstring, curr_line_index, parsed_values)  # type: ignore
-                break
+        # optimization: most lines are text, so check the first character before extracting a directive name
+        if line[:1] == ":" and (reader := get_reader(line[1:].split(":", 1)[0].split(" ", 1)[0])):  # noqa: WPS332
+            curr_line_index = reader(docstring, curr_line_index, parsed_values)
         else:
-            parsed_values.description.append(line)
+            append_description(line)
 
         curr_line_index += 1
 
@@ -193,11 +200,12 @@ def _determine_param_annotation(
     return annotation
 
 
-def _read_parameter_type(docstring: Docstring, offset: int, parsed_values: ParsedValues) -> int:
+def _read_type(kind: str, docstring: Docstring, offset: int, parsed_values: ParsedValues) -> int:
     """
-    Parse a parameter type.
+    Parse a parameter, attribute or return type.
 
     Arguments:
+        kind: The kind of element the type applies to: "parameter", "attribute" or "return".
         docstring: The docstring.
         offset: The line number to start at.
 
@@ -207,21 +215,35 @@ def _read_parameter_type(docstring: Docstring, offset: int, parsed_values: Parse
     parsed_directive = _parse_directive(docstring, offset)
     if parsed_directive.invalid:
         return parsed_directive.next_index
-    param_type = _consolidate_descriptive_type(parsed_directive.value.strip())
+    element_type = _consolidate_descriptive_type(parsed_directive.value.strip())
+
+    if kind == "return":
+        parsed_values.return_type = element_type
+        return_value = parsed_values.return_value
+        if return_value is not None:
+            return_value.annotation = element_type
+        return parsed_directive.next_index
 
     if len(parsed_directive.directive_parts) == 2:
-        param_name = parsed_directive.directive_parts[1]
+        name = parsed_directive.directive_parts[1]
     else:
-        warn(docstring, 0, f"Failed to get parameter name from '{parsed_directive.line}'")
+        warn(docstring, 0, f"Failed to get {kind} name from '{parsed_directive.line}'")
         return parsed_directive.next_index
 
-    parsed_values.param_types[param_name] = param_type
-    param = parsed_values.parameters.get(param_name)
-    if param is not None:
-        if param.annotation is None:
-            param.annotation = param_type
+    types: dict[str, str]
+    elements: dict[str, DocstringArgument] | dict[str, DocstringAttribute]
+    if kind == "parameter":
+        types, elements = parsed_values.param_types, parsed_values.parameters
+    else:
+        types, elements = parsed_values.attribute_types, parsed_values.attributes
+
+    types[name] = element_type
+    element = elements.get(name)
+    if element is not None:
+        if element.annotation is None:
+            element.annotation = element_type
         else:
-            warn(docstring, 0, f"Duplicate parameter information for '{param_name}'")
+            warn(docstring, 0, f"Duplicate {kind} information for '{name}'")
     return parsed_directive.next_index
 
 
@@ -268,38 +290,6 @@ def _read_attribute(docstring: Docstring, offset: int, parsed_values: ParsedValu
     return parsed_directive.next_index
 
 
-def _read_attribute_type(docstring: Docstring, offset: int, parsed_values: ParsedValues) -> int:
-    """
-    Parse a parameter type.
-
-    Arguments:
-        docstring: The docstring.
-        offset: The line number to start at.
-
-    Returns:
-        Index at which to continue parsing.
-    """
-    parsed_directive = _parse_directive(docstring, offset)
-    if parsed_directive.invalid:
-        return parsed_directive.next_index
-    attribute_type = _consolidate_descriptive_type(parsed_directive.value.strip())
-
-    if len(parsed_directive.directive_parts) == 2:
-        attribute_name = parsed_directive.directive_parts[1]
-    else:
-        warn(docstring, 0, f"Failed to get attribute name from '{parsed_directive.line}'")
-        return parsed_directive.next_index
-
-    parsed_values.attribute_types[attribute_name] = attribute_type
-    attribute = parsed_values.attributes.get(attribute_name)
-    if attribute is not None:
-        if attribute.annotation is None:
-            attribute.annotation = attribute_type
-        else:
-            warn(docstring, 0, f"Duplicate attribute information for '{attribute_name}'")
-    return parsed_directive.next_index
-
-
 def _read_exception(docstring: Docstring, offset: int, parsed_values: ParsedValues) -> int:
     """
     Parse an exceptions value.
@@ -358,30 +348,6 @@ def _read_return(docstring: Docstring, offset: int, parsed_values: ParsedValues)
     return parsed_directive.next_index
 
 
-def _read_return_type(docstring: Docstring, offset: int, parsed_values: ParsedValues) -> int:
-    """
-    Parse an return type value.
-
-    Arguments:
-        docstring: The docstring.
-        offset: The line number to start at.
-
-    Returns:
-        Index at which to continue parsing.
-    """
-    parsed_directive = _parse_directive(docstring, offset)
-    if parsed_directive.invalid:
-        return parsed_directive.next_index
-
-    return_type = _consolidate_descriptive_type(parsed_directive.value.strip())
-    parsed_values.return_type = return_type
-    return_value = parsed_values.return_value
-    if return_value is not None:
-        return_value.annotation = return_type
-
-    return parsed_directive.next_index
-
-
 def _parsed_values_to_sections(parsed_values: ParsedValues) -> list[DocstringSection]:
     text = "\n".join(_strip_blank_lines(parsed_values.description))
     result = [DocstringSection(DocstringSectionKind.text, text)]
@@ -407,7 +373,7 @@ def _parse_directive(docstring: Docstring, offset: int) -> ParsedDirective:
         return ParsedDirective(line, next_index, [], "", invalid=True)  # type: ignore
 
     value = value.strip()
-    return ParsedDirective(line, next_index, directive.split(" "), value)  # type: ignore
+    return ParsedDirective(line, next_index, directive.split(), value)  # type: ignore
 
 
 def _consolidate_continuation_lines(lines: list[str], offset: int) -> tuple[str, int]:
@@ -421,18 +387,18 @@ def _consolidate_continuation_lines(lines: list[str], offset: int) -> tuple[str,
     Returns:
         A tuple containing the continued lines as a single string and the index at which to continue parsing.
     """
-    curr_line_index = offset
-    block = [lines[curr_line_index].lstrip()]
-
-    # start processing after first item
-    curr_line_index += 1
-    while curr_line_index < len(lines) and not lines[curr_line_index].startswith(":"):
-        block.append(lines[curr_line_index].lstrip())
-        curr_line_index += 1
+    # find the end of the block first (start looking after first item),
+    # then strip and join all its lines in one go
+    lines_count = len(lines)
+    end_index = offset + 1
+    while end_index < lines_count and not lines[end_index].startswith(":"):
+        end_index += 1
 
-    return " ".join(block).rstrip("\n"), curr_line_index - 1
+    block = " ".join(line.lstrip() for line in lines[offset:end_index])
+    return block.rstrip("\n"), end_index - 1
 
 
+@lru_cache(maxsize=1024)
 def _consolidate_descriptive_type(descriptive_type: str) -> str:
     """Convert type descriptions with "or" into respective type signature.
 
@@ -456,29 +422,42 @@ def _strip_blank_lines(lines: list[str]) -> list[str]:
     Returns:
         A list with the same contents, with any blank lines at the start or end removed.
     """
-    if not lines:
-        return lines
-
-    # remove blank lines from the start and end
-    content_found = False
-    initial_content = 0
-    final_content = 0
-    for index, line in enumerate(lines):
-        if line == "" or line.isspace():
-            if not content_found:
-                initial_content += 1
-        else:
-            content_found = True
-            final_content = index
-    return lines[initial_content : final_content + 1]
+    # walk inwards from both ends, never looking at the lines in between
+    start = 0
+    end = len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    return lines[start:end]
 
 
 field_types = [
-    FieldType(PARAM_TYPE_NAMES, _read_parameter_type),  # type: ignore
+    FieldType(PARAM_TYPE_NAMES, partial(_read_type, "parameter")),  # type: ignore
     FieldType(PARAM_NAMES, _read_parameter),  # type: ignore
-    FieldType(ATTRIBUTE_TYPE_NAMES, _read_attribute_type),  # type: ignore
+    FieldType(ATTRIBUTE_TYPE_NAMES, partial(_read_type, "attribute")),  # type: ignore
     FieldType(ATTRIBUTE_NAMES, _read_attribute),  # type: ignore
     FieldType(EXCEPTION_NAMES, _read_exception),  # type: ignore
     FieldType(RETURN_NAMES, _read_return),  # type: ignore
-    FieldType(RETURN_TYPE_NAMES, _read_return_type),  # type: ignore
+    FieldType(RETURN_TYPE_NAMES, partial(_read_type, "return")),  # type: ignore
 ]
+
+# flat mapping used by the parser to dispatch directives with a single lookup
+field_readers: dict[str, Callable[[Docstring, int, ParsedValues], int]] = {}
+for _field_type in field_types:
+    field_readers.update(dict.fromkeys(_field_type.names, _field_type.reader))  # type: ignore
+del _field_type  # noqa: WPS420
+
+
+@lru_cache(maxsize=256)
+def _get_reader(name: str) -> Callable[[Docstring, int, ParsedValues], int] | None:
+    # directive names are matched by prefix, as field types do: `:params x:` is read as a parameter,
+    # and `:variables:` as an attribute (then reported as invalid); names are resolved once, then cached
+    reader = field_readers.get(name)
+    if reader is not None:
+        return reader
+    line = f":{name}"
+    for field_type in field_types:
+        if field_type.matches(line):
+            return field_type.reader  # type: ignore
+    return None
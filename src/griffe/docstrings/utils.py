@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 from griffe.logger import get_logger
@@ -21,6 +22,9 @@ def warn(docstring: Docstring, offset: int, message: str) -> None:
         offset: The offset in the docstring lines.
         message: The message to log.
     """
+    # optimization: don't build the log record when warnings are not displayed
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     try:
         prefix = docstring.parent.filepath  # type: ignore
     except AttributeError:
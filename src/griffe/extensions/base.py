@@ -144,6 +144,14 @@ class Extensions:
         """
         self._classes.extend(extensions_classes)
 
+    def copy(self) -> Extensions:
+        """Return a new container with the same visitor classes, but its own instances.
+
+        Returns:
+            A new extensions container.
+        """
+        return Extensions(*self._classes)
+
     def instantiate(self, main_visitor: MainVisitor) -> Extensions:
         """Clear and instantiate the visitor classes.
 
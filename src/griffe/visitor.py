@@ -12,12 +12,20 @@ import inspect
 from ast import AST, Attribute, BinOp, BitOr, Constant, Expr, Index, Name, PyCF_ONLY_AST, Str, Subscript
 from itertools import zip_longest
 from pathlib import Path
+from threading import Lock
 
 from griffe.collections import lines_collection
 from griffe.dataclasses import Argument, Arguments, Class, Decorator, Docstring, Function, Module
 from griffe.extensions import Extensions
 from griffe.extensions.base import _BaseVisitor  # noqa: WPS450
 
+# building AST nodes is not thread-safe on some CPython versions, see python/cpython#106905:
+# the recursion depth is tracked in interpreter-wide state, and a thread switch
+# during construction (for example when the garbage collector runs finalizers)
+# corrupts it, so modules loaded in parallel threads are compiled one at a time;
+# the lock can be removed once all supported Python versions include the fix
+_compile_lock = Lock()
+
 
 def visit(
     module_name: str,
@@ -115,7 +123,8 @@ class _MainVisitor(_BaseVisitor):  # noqa: WPS338
     def get_module(self) -> Module:
         # optimisation: equivalent to ast.parse, but with optimize=1 to remove assert statements
         # TODO: with options, could use optimize=2 to remove docstrings
-        top_node = compile(self.code, mode="exec", filename=str(self.filepath), flags=PyCF_ONLY_AST, optimize=1)
+        with _compile_lock:
+            top_node = compile(self.code, mode="exec", filename=str(self.filepath), flags=PyCF_ONLY_AST, optimize=1)
         self.visit(top_node)
         return self.current.module  # type: ignore  # there's always a module after the visit
 
@@ -1,5 +1,7 @@
 """Tests for the `cli` module."""
 
+import json
+
 import pytest
 
 from griffe import cli
@@ -21,3 +23,47 @@ def test_show_help(capsys):
         cli.main(["-h"])
     captured = capsys.readouterr()
     assert "griffe" in captured.out
+
+
+def test_main_async_loader_missing_package():
+    """Load packages asynchronously, one of them being missing."""
+    assert cli.main(["-A", "-s", "src", "griffe", "__missing__"]) == 1
+
+
+def test_main_per_package_output(tmp_path):
+    """
+    Write each package in its own file.
+
+    Arguments:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    output = str(tmp_path / "{package}.json")
+    assert cli.main(["-s", "src", "-s", ".", "griffe", "tests", "-o", output]) == 0
+    packages = cli._load_packages(["griffe", "tests"], extensions=None, search_paths=["src", "."])
+    for name, package in packages.items():
+        written = json.loads((tmp_path / f"{name}.json").read_text())
+        assert written == json.loads(cli._serialize(package))
+
+
+def test_main_threaded_loader_missing_package():
+    """Load packages in threads, one of them being missing."""
+    assert cli.main(["-T", "-s", "src", "griffe", "__missing__"]) == 1
+
+
+def test_main_threaded_loader_multiple_packages(tmp_path):
+    """
+    Load multiple packages in threads.
+
+    Arguments:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    output = tmp_path / "packages.json"
+    assert cli.main(["-T", "-s", "src", "-s", ".", "griffe", "tests", "-o", str(output)]) == 0
+    packages = cli._load_packages(["griffe", "tests"], extensions=None, search_paths=["src", "."])
+    assert json.loads(output.read_text()) == json.loads(cli._serialize(packages))
+
+
+def test_async_and_threaded_loaders_are_exclusive():
+    """Refuse to use both the async and threaded loaders."""
+    with pytest.raises(SystemExit):
+        cli.main(["-A", "-T", "-s", "src", "griffe"])
@@ -0,0 +1,38 @@
+"""Tests for the [`Docstring`][griffe.dataclasses.Docstring] class."""
+
+from griffe.dataclasses import Docstring
+from griffe.docstrings.parsers import Parser
+
+
+def test_docstring_parse_is_cached():
+    """Parse a docstring object only once for the same parser and options."""
+    docstring = Docstring("\nNote:\n    Hello.", lineno=1, endlineno=2)
+    sections = docstring.parse()
+    assert docstring.parse() is sections
+    assert docstring.parse(replace_admonitions=False) is not sections
+    assert docstring.parse(Parser.rst) is not sections
+
+
+def test_docstring_invalidate_parse_cache():
+    """Parse a docstring again after changing its value and invalidating it."""
+    docstring = Docstring("\nNote:\n    Hello.", lineno=1, endlineno=2)
+    assert docstring.parsed is docstring.parse()
+
+    docstring.value = "\nNote:\n    Goodbye."
+    docstring.invalidate()
+    assert docstring.lines == ["", "Note:", "    Goodbye."]
+    sections = docstring.parse()
+    assert "Goodbye." in sections[0].value
+    assert docstring.parsed is sections
+
+
+def test_docstring_invalidate_rst_parse_cache():
+    """Parse a docstring again with the RST parser after invalidating it."""
+    docstring = Docstring(":param foo: Hello.", lineno=1, endlineno=1)
+    sections = docstring.parse(Parser.rst)
+    assert docstring.parse(Parser.rst) is sections
+
+    docstring.value = ":param foo: Goodbye."
+    docstring.invalidate()
+    sections = docstring.parse(Parser.rst)
+    assert sections[1].value[0].description == "Goodbye."
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import inspect
 
+import pytest
+
 from griffe.dataclasses import Argument, Arguments, Class, Data, Docstring, Function, Module
 from griffe.docstrings import google as parser
 from griffe.docstrings.dataclasses import DocstringSectionKind
 
+POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+
 
 # =============================================================================================
 # Helpers
@@ -33,25 +38,48 @@ def parse(docstring: str, parent: Module | Class | Function | Data | None = None
     return sections, warnings
 
 
+@pytest.fixture()
+def function_xy_int() -> Function:
+    """Build a function with two integer arguments, returning an integer.
+
+    Returns:
+        A function.
+    """
+    arguments = Arguments()
+    arguments.add(Argument(name="x", annotation="int", kind=POSITIONAL_ONLY, default=None))
+    arguments.add(Argument(name="y", annotation="int", kind=POSITIONAL_ONLY, default=None))
+    return Function("func", arguments=arguments, returns="int")
+
+
+@pytest.fixture()
+def function_xy_untyped() -> Function:
+    """Build a function with two arguments, without any annotation.
+
+    Returns:
+        A function.
+    """
+    arguments = Arguments()
+    arguments.add(Argument(name="x", annotation=None, kind=POSITIONAL_ONLY, default=None))
+    arguments.add(Argument(name="y", annotation=None, kind=POSITIONAL_ONLY, default=None))
+    return Function("func", arguments=arguments, returns=None)
+
+
 # =============================================================================================
 # Markup flow (multilines, indentation, etc.)
-def test_simple_docstring():
-    """Parse a simple docstring."""
-    sections, warnings = parse("A simple docstring.")
-    assert len(sections) == 1
-    assert not warnings
-
+def test_parse_docstring_without_colon():
+    """Parse a docstring that cannot contain any section."""
+    docstring = """
+        A docstring without sections.
 
-def test_multiline_docstring():
-    """Parse a multi-line docstring."""
-    sections, warnings = parse(
-        """
-        A somewhat longer docstring.
+        ```python
+        print("code")
+        ```
+    """
 
-        Blablablabla.
-        """
-    )
+    sections, warnings = parse(docstring)
     assert len(sections) == 1
+    assert sections[0].kind is DocstringSectionKind.text
+    assert sections[0].value == inspect.cleandoc(docstring)
     assert not warnings
 
 
@@ -174,7 +202,7 @@ def test_parse_without_parent():
     assert "return" in warnings[-1]
 
 
-def test_parse_without_annotations():
+def test_parse_without_annotations(function_xy_untyped):
     """Parse a function docstring without signature annotations."""
     docstring = """
         Parameters:
@@ -186,12 +214,8 @@ def test_parse_without_annotations():
         Returns:
             Sum X + Y + Z.
     """
-    arguments = Arguments()
-    arguments.add(Argument(name="x", annotation=None, kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    arguments.add(Argument(name="y", annotation=None, kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    function = Function("func", arguments=arguments)
 
-    sections, warnings = parse(docstring, function)
+    sections, warnings = parse(docstring, function_xy_untyped)
     assert len(sections) == 3
     assert len(warnings) == 3
     for warning in warnings[:-1]:
@@ -213,8 +237,8 @@ def test_parse_with_annotations():
     """
 
     arguments = Arguments()
-    arguments.add(Argument(name="x", annotation="int", kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    arguments.add(Argument(name="y", annotation="int", kind=inspect.Parameter.POSITIONAL_OR_KEYWORD, default=None))
+    arguments.add(Argument(name="x", annotation="int", kind=POSITIONAL_ONLY, default=None))
+    arguments.add(Argument(name="y", annotation="int", kind=POSITIONAL_OR_KEYWORD, default=None))
     function = Function("func", arguments=arguments, returns="int")
 
     sections, warnings = parse(docstring, function)
@@ -224,20 +248,68 @@ def test_parse_with_annotations():
 
 # =============================================================================================
 # Sections (general)
-def test_parse_attributes_section():
-    """Parse Attributes sections."""
-    docstring = """
-        Attributes:
-            hey: Hey.
-            ho: Ho.
-    """
+@pytest.mark.parametrize(
+    ("docstring", "expected_sections", "expected_warnings"),
+    [
+        pytest.param("A simple docstring.", 1, 0, id="simple"),
+        pytest.param(
+            """
+            A somewhat longer docstring.
+
+            Blablablabla.
+            """,
+            1,
+            0,
+            id="multiline",
+        ),
+        pytest.param(
+            """
+            Attributes:
+                hey: Hey.
+                ho: Ho.
+            """,
+            1,
+            0,
+            id="attributes",
+        ),
+        pytest.param(
+            """
+            Parameters:
+                x: X.
+            Parameters:
+                y: Y.
+
+            Parameters:
+                z: Z.
+            Exceptions:
+                Error2: error.
+            Exceptions:
+                Error1: error.
+            Returns:
+                1.
+            Returns:
+                2.
+            """,
+            7,
+            5,  # no type or annotations
+            id="close sections",
+        ),
+    ],
+)
+def test_parse_sections_count(docstring, expected_sections, expected_warnings):
+    """Parse docstrings and count their sections and warnings.
 
+    Arguments:
+        docstring: A parametrized docstring.
+        expected_sections: The expected number of sections.
+        expected_warnings: The expected number of warnings.
+    """
     sections, warnings = parse(docstring)
-    assert len(sections) == 1
-    assert not warnings
+    assert len(sections) == expected_sections
+    assert len(warnings) == expected_warnings
 
 
-def test_parse_examples_sections():
+def test_parse_examples_sections(function_xy_int):
     """Parse a function docstring with examples."""
     docstring = """
         Examples:
@@ -292,17 +364,28 @@ def test_parse_examples_sections():
             False
         """
 
-    arguments = Arguments()
-    arguments.add(Argument(name="x", annotation="int", kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    arguments.add(Argument(name="y", annotation="int", kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    function = Function("func", arguments=arguments, returns="int")
-
-    sections, warnings = parse(docstring, function)
+    sections, warnings = parse(docstring, function_xy_int)
     assert len(sections) == 1
     assert len(sections[0].value) == 9
     assert not warnings
 
 
+def test_parse_unindented_examples_section():
+    """Keep an empty examples section when its contents are not indented."""
+    docstring = """
+        Examples:
+        >>> x = 1
+        Text.
+    """
+
+    sections, warnings = parse(docstring)
+    assert len(sections) == 2
+    assert sections[0].kind is DocstringSectionKind.examples
+    assert sections[0].value == [(DocstringSectionKind.text, "")]
+    assert sections[1].value == ">>> x = 1\nText."
+    assert not warnings
+
+
 def test_parse_yields_section():
     """Parse Yields section."""
     docstring = """
@@ -339,31 +422,6 @@ def test_invalid_sections():
     assert "Empty" in warnings[-1]
 
 
-def test_close_sections():
-    """Parse sections without blank lines in between."""
-    docstring = """
-        Parameters:
-            x: X.
-        Parameters:
-            y: Y.
-
-        Parameters:
-            z: Z.
-        Exceptions:
-            Error2: error.
-        Exceptions:
-            Error1: error.
-        Returns:
-            1.
-        Returns:
-            2.
-    """
-
-    sections, warnings = parse(docstring)
-    assert len(sections) == 7
-    assert len(warnings) == 5  # no type or annotations
-
-
 # =============================================================================================
 # Arguments sections
 def test_parse_args_and_kwargs():
@@ -410,7 +468,7 @@ def test_parse_args_kwargs_keyword_only():
     assert not warnings
 
 
-def test_parse_types_in_docstring():
+def test_parse_types_in_docstring(function_xy_untyped):
     """Parse types in docstring."""
     docstring = """
         Parameters:
@@ -423,12 +481,7 @@ def test_parse_types_in_docstring():
             int: Sum X + Y + Z.
     """
 
-    arguments = Arguments()
-    arguments.add(Argument(name="x", annotation=None, kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    arguments.add(Argument(name="y", annotation=None, kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    function = Function("func", arguments=arguments, returns=None)
-
-    sections, warnings = parse(docstring, function)
+    sections, warnings = parse(docstring, function_xy_untyped)
     assert len(sections) == 3
     assert not warnings
 
@@ -466,9 +519,9 @@ def test_parse_optional_type_in_docstring():
     """
 
     arguments = Arguments()
-    arguments.add(Argument(name="x", annotation=None, kind=inspect.Parameter.POSITIONAL_ONLY, default="1"))
-    arguments.add(Argument(name="y", annotation=None, kind=inspect.Parameter.POSITIONAL_ONLY, default="None"))
-    arguments.add(Argument(name="z", annotation=None, kind=inspect.Parameter.POSITIONAL_OR_KEYWORD, default="None"))
+    arguments.add(Argument(name="x", annotation=None, kind=POSITIONAL_ONLY, default="1"))
+    arguments.add(Argument(name="y", annotation=None, kind=POSITIONAL_ONLY, default="None"))
+    arguments.add(Argument(name="z", annotation=None, kind=POSITIONAL_OR_KEYWORD, default="None"))
     function = Function("func", arguments=arguments, returns=None)
 
     sections, warnings = parse(docstring, function)
@@ -497,7 +550,7 @@ def test_parse_optional_type_in_docstring():
     assert argz.value == "None"
 
 
-def test_prefer_docstring_types_over_annotations():
+def test_prefer_docstring_types_over_annotations(function_xy_int):
     """Prefer the docstring type over the annotation."""
     docstring = """
         Parameters:
@@ -510,12 +563,7 @@ def test_prefer_docstring_types_over_annotations():
             str: Sum X + Y + Z.
     """
 
-    arguments = Arguments()
-    arguments.add(Argument(name="x", annotation="int", kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    arguments.add(Argument(name="y", annotation="int", kind=inspect.Parameter.POSITIONAL_ONLY, default=None))
-    function = Function("func", arguments=arguments, returns="int")
-
-    sections, warnings = parse(docstring, function)
+    sections, warnings = parse(docstring, function_xy_int)
     assert len(sections) == 3
     assert not warnings
 
@@ -635,6 +683,14 @@ def test_replace_unknown_with_admonitions():
     assert "!!! something" in sections[0].value
 
 
+def test_replace_admonitions_keeps_docstring_lines():
+    """Replace admonitions without modifying the lines cached on the docstring."""
+    docstring = Docstring("\nNote:\n    Hello.", lineno=1, endlineno=2)
+    sections = parser.parse(docstring)
+    assert sections[0].value.startswith("!!! note")
+    assert docstring.lines == ["Note:", "    Hello."]
+
+
 # TODO: allow titles in section!
 def test_replace_titled_unknown_with_admonitions():
     """Replace unknown section with their Markdown admonition equivalent, keeping their title."""
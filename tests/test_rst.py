@@ -144,6 +144,29 @@ def test_parse__param_field__param_section():
     assert_argument_equal(sections[1].value[0], DocstringArgument(SOME_NAME, annotation=None, description=SOME_TEXT))
 
 
+def test_parse__param_field_extra_spaces__param_section():
+    """Parse a parameter directive containing runs of spaces."""
+    sections, warnings = parse(f":param  int   {SOME_NAME}: {SOME_TEXT}")
+    assert len(sections) == 2
+    assert_argument_equal(sections[1].value[0], DocstringArgument(SOME_NAME, annotation="int", description=SOME_TEXT))
+    assert not warnings
+
+
+def test_parse__params_field__param_section():
+    """Parse a parameter directive matched by prefix."""
+    sections, _ = parse(f":params {SOME_NAME}: {SOME_TEXT}")
+    assert len(sections) == 2
+    assert sections[1].kind is DocstringSectionKind.arguments
+    assert_argument_equal(sections[1].value[0], DocstringArgument(SOME_NAME, annotation=None, description=SOME_TEXT))
+
+
+def test_parse__variables_field__invalid_attribute_warning():
+    """Warn on an attribute directive matched by prefix, without a name."""
+    sections, warnings = parse(":variables:")
+    assert len(sections) == 1
+    assert "Failed to parse field directive from ':variables:'" in warnings[0]
+
+
 def test_parse__only_param_field__empty_markdown():
     """Parse only a parameter section."""
     sections, _ = parse(":param foo: text")